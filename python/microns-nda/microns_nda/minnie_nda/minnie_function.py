@@ -1,4 +1,7 @@
 import functools
+import inspect
+import multiprocessing as mp
+from collections import namedtuple
 import datajoint as dj
 import datajoint_plus as djp
 import pandas as pd
@@ -9,16 +12,139 @@ from microns_nda_api.schemas import minnie_function, minnie_nda
 import logging
 
 # Utility functions
+@functools.lru_cache(maxsize=None)
+def _virtual_module(module_name, schema_name):
+    # one virtual module per (module_name, schema_name) for the whole process
+    return djp.create_djp_module(module_name, schema_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _free_table(full_table_name):
+    # one FreeTable per table for the whole process, its heading is loaded only once
+    return dj.FreeTable(dj.conn(), full_table_name)
+
+
+def _has_rows(expr):
+    # fetches at most one key, bool(expr) would count every row of expr
+    return bool(expr.fetch("KEY", limit=1))
+
+
+def _resolve_pk(table, key=None):
+    # a dict that already holds the full primary key is used without a query
+    if isinstance(key, dict) and set(table.primary_key).issubset(key):
+        return {attr: key[attr] for attr in table.primary_key}
+    return table.fetch1("KEY") if key is None else (table & key).fetch1("KEY")
+
+
+@functools.lru_cache(maxsize=None)
+def _source_key(part, hash):
+    # the source entry behind a hashed part entry never changes, resolve it once per hash
+    return (part.source & (part & {part.hash_name: hash})).fetch1("KEY")
+
+
+def _add_hash_to_rows(table, rows, constant_attrs=None):
+    # rows sharing hashed_attrs share a hash, hash each distinct combination once,
+    # constant_attrs are hashed with every row without adding them as columns to rows
+    constant_attrs = {} if constant_attrs is None else constant_attrs
+    attrs = [attr for attr in table.hashed_attrs if attr not in constant_attrs]
+    hashes = table.add_hash_to_rows(
+        rows[attrs].drop_duplicates().assign(**constant_attrs)
+    )
+    return rows.merge(hashes[[*attrs, table.hash_name]], on=attrs, how="left")
+
+
+def _insert_chunks(table, rows, chunk_size=5000, **insert_kws):
+    # inserts a DataFrame with one INSERT per chunk_size rows to keep each statement
+    # below max_allowed_packet, call within a transaction to insert all rows or none;
+    # with ignore_extra_fields the extra columns are dropped once instead of per row
+    if insert_kws.get("ignore_extra_fields"):
+        rows = rows[[name for name in rows.columns if name in table.heading.names]]
+    for start in range(0, len(rows), chunk_size):
+        table.insert(rows.iloc[start : start + chunk_size], **insert_kws)
+
+
+def _initialize_fill():
+    # a forked worker must not share the parent's MySQL connection
+    dj.conn().connect()
+
+
+def _fill(table):
+    table.fill()
+
+
+def _accepted_kws(method, **kws):
+    # the keyword arguments in kws that method accepts
+    parameters = inspect.signature(method).parameters
+    return {name: value for name, value in kws.items() if name in parameters}
+
+
+def _fill_parts(parts, processes=1):
+    # fills independent part tables, in worker processes when processes > 1
+    processes = min(processes, len(parts))
+    if processes > 1:
+        with mp.Pool(processes, _initialize_fill) as pool:
+            pool.map(_fill, parts, chunksize=1)
+    else:
+        for part in parts:
+            part.fill()
+
+
+def _delegate_to_source(*names):
+    # class decorator adding the accessors in names, each resolves a single entry with
+    # the _source method of the class and calls the same accessor on the source table
+    def accessor(name):
+        def method(self, key=None):
+            source, source_key = self._source(key)
+            return getattr(source, name)(source_key)
+
+        method.__name__ = name
+        return method
+
+    def decorate(cls):
+        for name in names:
+            setattr(cls, name, accessor(name))
+        return cls
+
+    return decorate
+
+
+class LazyVirtualModule:
+    # stands in for a virtual module, creates it on first attribute access
+    def __init__(self, module_name, schema_name):
+        self.module_name = module_name
+        self.schema_name = schema_name
+
+    def __getattr__(self, name):
+        return getattr(_virtual_module(self.module_name, self.schema_name), name)
+
+
+class VirtualModules(dict):
+    # spawns virtual modules listed in virtual_module_dict on first lookup
+    def __init__(self, virtual_module_dict):
+        super().__init__()
+        self.virtual_module_dict = virtual_module_dict
+
+    def __missing__(self, module_name):
+        self[module_name] = _virtual_module(
+            module_name, self.virtual_module_dict[module_name]
+        )
+        return self[module_name]
+
+
 class VMMixin:
     ## virtual module management
-    virtual_modules = {}
+    virtual_module_dict = {}
+
+    @classproperty
+    def virtual_modules(cls):
+        if "_virtual_modules" not in cls.__dict__:
+            cls._virtual_modules = VirtualModules(cls.virtual_module_dict)
+        return cls._virtual_modules
 
     @classmethod
     def update_virtual_modules(cls, module_name, schema_name):
         if module_name not in cls.virtual_modules:
-            cls.virtual_modules[module_name] = djp.create_djp_module(
-                module_name, schema_name
-            )
+            cls.virtual_modules[module_name] = _virtual_module(module_name, schema_name)
 
     @classmethod
     def spawn_virtual_modules(cls, virtual_module_dict):
@@ -50,6 +176,16 @@ class ScanSet(minnie_function.ScanSet):
         )
 
 
+def _scan_set_hash(scan_keys):
+    # ScanSet hash of a list of unique scan keys, computed once per set of scans
+    return _hash_scan_set(frozenset(tuple(sorted(key.items())) for key in scan_keys))
+
+
+@functools.lru_cache(maxsize=None)
+def _hash_scan_set(scan_keys):
+    return ScanSet.hash1([dict(key) for key in scan_keys], unique=True)
+
+
 class ResponseType(minnie_function.ResponseType):
     contents = [
         ("in_vivo", "Tuning properties extracted from in vivo responses."),
@@ -87,7 +223,35 @@ class StimTypeGrp(minnie_function.StimTypeGrp):
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _stim_type_grp_hash(stimulus_types):
+    # hashes a frozenset of stimulus types and checks the group exists in StimTypeGrp,
+    # failed checks raise and are not cached
+    stim_type_grp_hash = StimTypeGrp.add_hash_to_rows(
+        [{"stimulus_type": s} for s in sorted(stimulus_types)]
+    )[StimTypeGrp.hash_name].unique()
+    assert len(stim_type_grp_hash) == 1
+    stim_type_grp_hash = stim_type_grp_hash[0]
+    assert StimTypeGrp.restrict_with_hash(
+        stim_type_grp_hash
+    ), "stim_type_grp_hash does not exist in StimTypeGrp"
+    return stim_type_grp_hash
+
+
 # Orientation
+OrientationSummary = namedtuple(
+    "OrientationSummary",
+    [
+        "stimulus_type",
+        "response_type",
+        "animal_id",
+        "scan_session",
+        "scan_idx",
+        "len_sec",
+    ],
+)
+
+
 ## Faithful copy of functional properties from external database
 class OrientationDV11521GD(minnie_function.OrientationDV11521GD, VMMixin):
     class Unit(minnie_function.OrientationDV11521GD.Unit):
@@ -105,7 +269,6 @@ class OrientationDV11521GD(minnie_function.OrientationDV11521GD, VMMixin):
 
     @classmethod
     def fill(cls):
-        cls.spawn_virtual_modules(cls.virtual_module_dict)
         master = (
             cls.virtual_modules["dv_tunings_v2_direction"].BiVonMises()
             * cls.virtual_modules["dv_tunings_v2_direction"]
@@ -124,10 +287,9 @@ class OrientationDV11521GD(minnie_function.OrientationDV11521GD, VMMixin):
             )
             & ScanSet.Member()
         )
-        target = master.proj() - cls.proj()
-        if len(target) == 0:
+        # stop early when there are no new tunings
+        if not _has_rows(master.proj() - cls.proj()):
             return
-        cls.insert(target, ignore_extra_fields=True, skip_duplicates=True)
         unit = (
             (
                 cls.virtual_modules["dv_tunings_v2_direction"].BiVonMises().Unit
@@ -146,7 +308,6 @@ class OrientationDV11521GD(minnie_function.OrientationDV11521GD, VMMixin):
                 .proj(..., tuning_curve_mu="mu", tuning_curve_sigma="sigma")
             ).proj(..., scan_session="session")
             & ScanSet.Member()
-            & target.proj()
         )
         # Add back all functional units (some were removed in dyanmic vision because they were not unique units)
         unique_id = (
@@ -154,27 +315,31 @@ class OrientationDV11521GD(minnie_function.OrientationDV11521GD, VMMixin):
             * cls.virtual_modules["dv_nns_v5_scan"].ScanConfig
             * cls.virtual_modules["dv_scans_v1_scan_dataset"].UnitConfig().Unique()
         )
+        # evaluate the unique_id join once, both sides are restricted by its keys
+        unique_keys = (unique_id & ScanSet.Member()).fetch("KEY")
         neuron2unit = (
             cls.virtual_modules["dv_scans_v1_scan"].Unique.Neuron.proj(
                 ..., scan_session="session"
             )
-            & unique_id
+            & unique_keys
             & ScanSet.Member()
         ).proj(..., unique_unit_id="unit_id") * (
             cls.virtual_modules["dv_scans_v1_scan"].Unique.Unit.proj(
                 scan_session="session"
             )
-            & unique_id
+            & unique_keys
             & ScanSet.Member()
         )
         unit = unit.proj(..., unique_unit_id="unit_id") * neuron2unit
-        cls.Unit.insert(unit, ignore_extra_fields=True, skip_duplicates=True)
+        # both inserts run as INSERT ... SELECT, existing rows are skipped by the server
+        with cls.connection.transaction:
+            cls.insert(master, ignore_extra_fields=True, skip_duplicates=True)
+            cls.Unit.insert(unit, ignore_extra_fields=True, skip_duplicates=True)
 
     def stimulus_type(self, key=None):
         # returns list of stimuli used in the tuning
         # elements of the list are stimulus_type in the pipeline_stimulus.Condition table
-        self.spawn_virtual_modules(self.virtual_module_dict)
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
+        key = _resolve_pk(self, key)
         return list(
             (
                 dj.U("stimulus_type")
@@ -189,10 +354,25 @@ class OrientationDV11521GD(minnie_function.OrientationDV11521GD, VMMixin):
             ).fetch("stimulus_type")
         )
 
+    def all_stimulus_types(self):
+        # returns the set of stimulus_type used by all entries, in one query
+        return set(
+            (
+                dj.U("stimulus_type")
+                & (
+                    (
+                        self.virtual_modules["dv_tunings_v2_response"].ResponseSet.Slice
+                        & self.proj()
+                    )
+                    * self.virtual_modules["dv_stimuli_v1_stimulus"].StimulusCondition
+                    * self.virtual_modules["pipeline_stimulus"].Condition
+                )
+            ).fetch("stimulus_type")
+        )
+
     def response_type(self, key=None):
         # returns {'in_vivo', 'in_silico'}
-        self.spawn_virtual_modules(self.virtual_module_dict)
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
+        key = _resolve_pk(self, key)
         response_type = (
             self.virtual_modules["dv_tunings_v2_response"].ResponseConfig & key
         ).fetch1("response_type")
@@ -207,8 +387,7 @@ class OrientationDV11521GD(minnie_function.OrientationDV11521GD, VMMixin):
         return response_mapping[response_type]
 
     def scan(self, key=None):
-        self.spawn_virtual_modules(self.virtual_module_dict)
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
+        key = _resolve_pk(self, key)
         return (
             (self & key).proj()
             * self.virtual_modules["dv_tunings_v2_response"].ResponseInfo.Scan.proj(
@@ -217,8 +396,7 @@ class OrientationDV11521GD(minnie_function.OrientationDV11521GD, VMMixin):
         ).fetch1("animal_id", "scan_session", "scan_idx")
 
     def len_sec(self, key=None):
-        self.spawn_virtual_modules(self.virtual_module_dict)
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
+        key = _resolve_pk(self, key)
         return self.aggr(
             (
                 self.virtual_modules["dv_tunings_v2_response"].ResponseSet.Slice & key
@@ -226,15 +404,51 @@ class OrientationDV11521GD(minnie_function.OrientationDV11521GD, VMMixin):
             len_sec="sum(sec)",
         ).fetch1("len_sec")
 
+    def summary(self, key=None):
+        # response type, scan and stimulus length in one query, stimulus types in another
+        key = _resolve_pk(self, key)
+        response_type, animal_id, scan_session, scan_idx, len_sec = (
+            (
+                (self & key).proj()
+                * self.virtual_modules["dv_tunings_v2_response"].ResponseConfig.proj(
+                    "response_type"
+                )
+                * self.virtual_modules["dv_tunings_v2_response"].ResponseInfo.Scan.proj(
+                    scan_session="session"
+                )
+            ).aggr(
+                self.virtual_modules["dv_tunings_v2_response"].ResponseSet.Slice.proj(
+                    sec="n_frames / hz"
+                ),
+                ...,
+                len_sec="sum(sec)",
+            )
+        ).fetch1("response_type", "animal_id", "scan_session", "scan_idx", "len_sec")
+        response_mapping = {
+            "Scan1Mean": "in_vivo",
+            "Nn5Pure": "in_silico",
+        }
+        assert (
+            response_type in response_mapping
+        ), f"response_type not supported, consider delete entry {key}"
+        return OrientationSummary(
+            stimulus_type=self.stimulus_type(key),
+            response_type=response_mapping[response_type],
+            animal_id=animal_id,
+            scan_session=scan_session,
+            scan_idx=scan_idx,
+            len_sec=len_sec,
+        )
+
 
 class OrientationDV231042(minnie_function.OrientationDV231042):
-    class Unit(minnie_function.OrientationDV11521GD.Unit):
+    class Unit(minnie_function.OrientationDV231042.Unit):
         pass
 
-    dv_scan = djp.create_djp_module("dv_scan", "dv_scans_v3_scan")
-    dv_oracle = djp.create_djp_module("dv_oracle", "dv_scans_v3_oracle")
-    dv_nns_scan = djp.create_djp_module("dv_nns_scan", "dv_nns_v10_scan")
-    dv_direction = djp.create_djp_module("dv_direction", "dv_tunings_v4_direction")
+    dv_scan = LazyVirtualModule("dv_scan", "dv_scans_v3_scan")
+    dv_oracle = LazyVirtualModule("dv_oracle", "dv_scans_v3_oracle")
+    dv_nns_scan = LazyVirtualModule("dv_nns_scan", "dv_nns_v10_scan")
+    dv_direction = LazyVirtualModule("dv_direction", "dv_tunings_v4_direction")
 
     @classmethod
     def fill(cls):
@@ -253,14 +467,18 @@ class OrientationDV231042(minnie_function.OrientationDV231042):
                 ..., unique_unit_id="unit_id", uniform_mse="mse"
             )
         ).proj(..., scan_session="session")
-        master_rel = dj.U(*cls.primary_key) & unit_rel
-        cls.insert(master_rel, ignore_extra_fields=True, skip_duplicates=True)
-        cls.Unit.insert(unit_rel, ignore_extra_fields=True, skip_duplicates=True)
+        # new units may belong to tunings already in the master, so the unit insert
+        # is not restricted by the new master keys
+        master_keys = ((dj.U(*cls.primary_key) & unit_rel) - cls).fetch("KEY")
+        with cls.connection.transaction:
+            if master_keys:
+                cls.insert(master_keys, ignore_extra_fields=True, skip_duplicates=True)
+            cls.Unit.insert(unit_rel, ignore_extra_fields=True, skip_duplicates=True)
 
     def stimulus_type(self, key=None):
         # returns list of stimuli used in the tuning
         # elements of the list are stimulus_type in the pipeline_stimulus.Condition table
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
+        key = _resolve_pk(self, key)
         assert (
             (self & key)
             * self.dv_direction.DirectionConfig.Mean()
@@ -270,9 +488,22 @@ class OrientationDV231042(minnie_function.OrientationDV231042):
             "stimulus.Monet2",
         ]
 
+    def all_stimulus_types(self):
+        # returns the set of stimulus_type used by all entries, in one query
+        rel = self.proj()
+        assert not _has_rows(
+            rel
+            - (
+                rel
+                * self.dv_direction.DirectionConfig.Mean()
+                * self.dv_direction.DirectionResponseConfig().Nn10Monet2()
+            ).proj()
+        ), "stimulus type not implemented"
+        return {"stimulus.Monet2"} if _has_rows(rel) else set()
+
     def response_type(self, key=None):
         # returns {'in_vivo', 'in_silico'}
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
+        key = _resolve_pk(self, key)
         assert (
             (self & key)
             * self.dv_direction.DirectionConfig.Mean()
@@ -281,11 +512,11 @@ class OrientationDV231042(minnie_function.OrientationDV231042):
         return "in_silico"
 
     def scan(self, key=None):
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
+        key = _resolve_pk(self, key)
         return ((self & key).proj()).fetch1("animal_id", "scan_session", "scan_idx")
 
     def len_sec(self, key=None):
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
+        key = _resolve_pk(self, key)
         direction_stimulus_rel = (
             (self & key)
             * self.dv_direction.DirectionConfig.Mean()
@@ -295,87 +526,118 @@ class OrientationDV231042(minnie_function.OrientationDV231042):
         assert direction_stimulus_rel, "stimulus type not implemented!"
         return direction_stimulus_rel.proj(sec="duration * n_rng_seeds").fetch1("sec")
 
-    def tuning_curve(self, key=None):
-        key = self.fetch1() if key is None else (self & key).fetch1()
-        cfg_part_table = (self.dv_direction.DirectionConfig & key).fetch1(
-            "direction_type"
+    def summary(self, key=None):
+        # stimulus type, response type, scan and stimulus length in one query
+        key = _resolve_pk(self, key)
+        direction_stimulus_rel = (
+            (self & key)
+            * self.dv_direction.DirectionConfig.Mean()
+            * self.dv_direction.DirectionResponseConfig().Nn10Monet2()
+            * self.dv_direction.DirectionStimulusConfig().Monet2()
+        ).proj(sec="duration * n_rng_seeds")
+        rows = direction_stimulus_rel.fetch(
+            "animal_id", "scan_session", "scan_idx", "sec", as_dict=True
         )
-        cfg_part_table = getattr(self.dv_direction.DirectionConfig, cfg_part_table)
-        cfg_part_table &= key
+        assert len(rows) == 1, "stimulus type not implemented!"
+        return OrientationSummary(
+            stimulus_type=["stimulus.Monet2"],
+            response_type="in_silico",
+            animal_id=rows[0]["animal_id"],
+            scan_session=rows[0]["scan_session"],
+            scan_idx=rows[0]["scan_idx"],
+            len_sec=rows[0]["sec"],
+        )
+
+    def tuning_curve(self, key=None):
+        rel = self if key is None else self & key
+        direction_config = self.dv_direction.DirectionConfig & rel
+        cfg_part_table = [
+            getattr(self.dv_direction.DirectionConfig, direction_type) & rel
+            for direction_type in (dj.U("direction_type") & direction_config).fetch(
+                "direction_type"
+            )
+        ]
         unit_df = pd.DataFrame(
             (
                 self.dv_direction.DirectionResponse.Unit.proj(
                     ..., scan_session="session"
                 )
                 * self.dv_direction.DirectionResponse.Direction
+                * rel
                 & cfg_part_table
-                & key
             ).fetch(
-                "scan_session",
-                "scan_idx",
+                *self.primary_key,
                 "unit_id",
                 "direction",
                 "response_mean",
                 "response_std",
-                "n_trials",
                 as_dict=True,
             )
         )
-        unit_id, direction, response_mean, response_std = [], [], [], []
-        for u, g in unit_df.groupby("unit_id"):
-            data = g.sort_values("direction")[
-                ["direction", "response_mean", "response_std"]
-            ]
-            unit_id.append(u)
-            direction.append(data.direction.to_numpy() / 180 * np.pi)
-            response_mean.append(data.response_mean.to_numpy())
-            response_std.append(data.response_std.to_numpy())
-        tuning_curve_df = pd.DataFrame(
-            dict(
-                unit_id=unit_id,
-                direction=direction,
-                response_mean=response_mean,
-                response_std=response_std,
-                **key,
+        # one row per unit of every requested tuning entry, sorted once so that
+        # each unit is a contiguous slice of the underlying arrays
+        group_attrs = [*self.primary_key, "unit_id"]
+        unit_df = unit_df.sort_values([*group_attrs, "direction"], ignore_index=True)
+        group_size = unit_df.groupby(group_attrs, sort=False).size()
+        offsets = np.cumsum(group_size.to_numpy())[:-1]
+        # convert all directions to radians in place, the per unit splits are views
+        direction = unit_df["direction"].to_numpy(dtype=float, copy=True)
+        np.deg2rad(direction, out=direction)
+        tuning_curve_df = group_size.index.to_frame(index=False)
+        for attr, values in [
+            ("direction", direction),
+            ("response_mean", unit_df["response_mean"].to_numpy()),
+            ("response_std", unit_df["response_std"].to_numpy()),
+        ]:
+            tuning_curve_df[attr] = pd.Series(
+                np.split(values, offsets), index=tuning_curve_df.index
             )
-        )
-        return tuning_curve_df
+        return tuning_curve_df[
+            ["unit_id", "direction", "response_mean", "response_std", *self.primary_key]
+        ]
 
 
 ## Aggregation tables
+@_delegate_to_source("stimulus_type", "response_type", "scan", "len_sec", "summary")
 class Orientation(minnie_function.Orientation):
     @classmethod
-    def fill(cls):
-        for part in cls.parts(as_cls=True):
-            part.fill()
-
-    def stimulus_type(self, key=None):
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
-        return (self & key).part_table().stimulus_type()
-
-    def response_type(self, key=None):
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
-        return (self & key).part_table().response_type()
-
-    def scan(self, key=None):
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
-        return (self & key).part_table().scan()
-
-    def len_sec(self, key=None):
-        key = self.fetch1("KEY") if key is None else (self & key).fetch1("KEY")
-        return (self & key).part_table().len_sec()
+    def fill(cls, processes=1):
+        _fill_parts(cls.parts(as_cls=True), processes=processes)
+
+    def _source(self, key=None):
+        # resolves a single entry to its source table and source key,
+        # the source key is cached per orientation_hash
+        rel = self if key is None else self & key
+        orientation_hash, orientation_type = rel.fetch1(
+            self.hash_name, "orientation_type"
+        )
+        source_key = _source_key(getattr(self, orientation_type), orientation_hash)
+        return getattr(self, orientation_type).source & source_key, source_key
 
     @classmethod
     def all_stimulus_types(cls):
-        return functools.reduce(
-            lambda a, b: {*a, *b},
-            [(cls & key).stimulus_type() for key in cls.fetch("KEY")],
+        # one query per orientation type instead of one per entry
+        return set().union(
+            *[
+                (part.source & part).all_stimulus_types()
+                for part in cls.parts(as_cls=True)
+            ]
         )
 
     def tuning_curve(self, key=None):
-        key = self.fetch1() if key is None else (self & key).fetch1()
-        return (self & key).part_table().tuning_curve()
+        # accepts multiple entries, one query per orientation type
+        rel = self if key is None else self & key
+        return pd.concat(
+            [
+                (getattr(self, orientation_type) & rel).tuning_curve()
+                for orientation_type in (dj.U("orientation_type") & rel).fetch(
+                    "orientation_type"
+                )
+            ],
+            ignore_index=True,
+        )
 
+    @_delegate_to_source("stimulus_type", "response_type", "scan", "len_sec")
     class DV11521GD(minnie_function.Orientation.DV11521GD):
         @classproperty
         def source(cls):
@@ -383,36 +645,29 @@ class Orientation(minnie_function.Orientation):
 
         @classmethod
         def fill(cls):
+            source = cls.source - cls
+            if not _has_rows(source):
+                return
             constant_attrs = {
                 "orientation_type": Orientation.DV11521GD.__name__,
             }
             cls.insert(
-                cls.source,
+                source,
                 insert_to_master=True,
                 constant_attrs=constant_attrs,
                 ignore_extra_fields=True,
                 skip_duplicates=True,
             )
 
-        def stimulus_type(self, key=None):
-            key = self.fetch1() if key is None else (self & key).fetch1()
-            return (self.source & key).stimulus_type()
-
-        def response_type(self, key=None):
-            key = self.fetch1() if key is None else (self & key).fetch1()
-            return (self.source & key).response_type()
-
-        def scan(self, key=None):
-            key = self.fetch1() if key is None else (self & key).fetch1()
-            return (self.source & key).scan()
-
-        def len_sec(self, key=None):
-            key = self.fetch1() if key is None else (self & key).fetch1()
-            return (self.source & key).len_sec()
+        def _source(self, key=None):
+            hash = _resolve_pk(self, key)[self.hash_name]
+            source_key = _source_key(self.__class__, hash)
+            return self.source & source_key, source_key
 
         def tuning_curve(self, key=None):
             raise NotImplementedError
 
+    @_delegate_to_source("stimulus_type", "response_type", "scan", "len_sec")
     class DV231042(minnie_function.Orientation.DV231042):
         @classproperty
         def source(cls):
@@ -420,36 +675,28 @@ class Orientation(minnie_function.Orientation):
 
         @classmethod
         def fill(cls):
+            source = cls.source - cls
+            if not _has_rows(source):
+                return
             constant_attrs = {
                 "orientation_type": Orientation.DV231042.__name__,
             }
             cls.insert(
-                cls.source,
+                source,
                 insert_to_master=True,
                 constant_attrs=constant_attrs,
                 ignore_extra_fields=True,
                 skip_duplicates=True,
             )
 
-        def stimulus_type(self, key=None):
-            key = self.fetch1() if key is None else (self & key).fetch1()
-            return (self.source & key).stimulus_type()
-
-        def response_type(self, key=None):
-            key = self.fetch1() if key is None else (self & key).fetch1()
-            return (self.source & key).response_type()
-
-        def scan(self, key=None):
-            key = self.fetch1() if key is None else (self & key).fetch1()
-            return (self.source & key).scan()
-
-        def len_sec(self, key=None):
-            key = self.fetch1() if key is None else (self & key).fetch1()
-            return (self.source & key).len_sec()
+        def _source(self, key=None):
+            hash = _resolve_pk(self, key)[self.hash_name]
+            source_key = _source_key(self.__class__, hash)
+            return self.source & source_key, source_key
 
         def tuning_curve(self, key=None):
-            key = self.fetch1() if key is None else (self & key).fetch1()
-            return (OrientationDV231042 & key).tuning_curve()
+            rel = self if key is None else self & key
+            return (OrientationDV231042 & rel).tuning_curve()
 
 
 class OrientationScanInfo(minnie_function.OrientationScanInfo):
@@ -458,37 +705,27 @@ class OrientationScanInfo(minnie_function.OrientationScanInfo):
         return Orientation
 
     def make(self, key):
-        stim_type_grp = (Orientation & key).stimulus_type()
-        stim_type_grp = [{"stimulus_type": s} for s in stim_type_grp]
-        stim_type_grp_hash = StimTypeGrp.add_hash_to_rows(stim_type_grp)[
-            StimTypeGrp.hash_name
-        ].unique()
-        assert len(stim_type_grp_hash) == 1
-        stim_type_grp_hash = stim_type_grp_hash[0]
-        assert StimTypeGrp.restrict_with_hash(
-            stim_type_grp_hash
-        ), "stim_type_grp_hash does not exist in StimTypeGrp"
-        response_type = (Orientation & key).response_type()
-        animal_id, scan_session, scan_idx = (Orientation & key).scan()
-        stimulus_length = round((Orientation & key).len_sec(), 2)
+        summary = (Orientation & key).summary()
+        stim_type_grp_hash = _stim_type_grp_hash(frozenset(summary.stimulus_type))
         self.insert1(
             dict(
                 key,
                 stim_type_grp_hash=stim_type_grp_hash,
-                response_type=response_type,
-                stimulus_length=stimulus_length,
-                animal_id=animal_id,
-                scan_session=scan_session,
-                scan_idx=scan_idx,
+                response_type=summary.response_type,
+                stimulus_length=round(summary.len_sec, 2),
+                animal_id=summary.animal_id,
+                scan_session=summary.scan_session,
+                scan_idx=summary.scan_idx,
             )
         )
 
     def tuning_curve(self, percentile=False):
-        assert minnie_nda.Scan().aggr(self, count="count(*)").fetch("count").max() == 1
-        tuning_curve = []
-        for key in self.fetch("KEY"):
-            tuning_curve.append((Orientation & key).tuning_curve())
-        return pd.concat(tuning_curve, ignore_index=True)
+        # fetches at most one scan with multiple entries instead of every scan count
+        assert not _has_rows(
+            minnie_nda.Scan().aggr(self, count="count(*)") & "count > 1"
+        ), "multiple entries for the same scan"
+        # all entries in one batched fetch per orientation type
+        return (Orientation & self.proj()).tuning_curve()
 
 
 class OrientationScanSet(minnie_function.OrientationScanSet):
@@ -499,19 +736,18 @@ class OrientationScanSet(minnie_function.OrientationScanSet):
     def fill(cls, keys, description=""):
         keys = (OrientationScanInfo.proj() & keys).fetch("KEY")
         # check here all scans are unique
-        assert len(OrientationScanInfo & keys) == len(
-            minnie_nda.Scan * OrientationScanInfo & keys
-        )
+        assert not _has_rows(
+            dj.U("animal_id", "scan_session", "scan_idx").aggr(
+                minnie_nda.Scan * OrientationScanInfo & keys, n="count(*)"
+            )
+            & "n > 1"
+        ), "non-unique scans"
         scan_keys = (minnie_nda.Scan & (OrientationScanInfo & keys)).fetch("KEY")
-        scan_set_hash = ScanSet.add_hash_to_rows(scan_keys)[ScanSet.hash_name].unique()[
-            0
-        ]
-        response_type = (dj.U("response_type") & (OrientationScanInfo & keys)).fetch1(
-            "response_type"
-        )
-        stim_type_grp_hash = (
-            dj.U("stim_type_grp_hash") & (OrientationScanInfo & keys)
-        ).fetch1("stim_type_grp_hash")
+        scan_set_hash = _scan_set_hash(scan_keys)
+        # fails unless all members share the same response_type and stim_type_grp_hash
+        response_type, stim_type_grp_hash = (
+            dj.U("response_type", "stim_type_grp_hash") & (OrientationScanInfo & keys)
+        ).fetch1("response_type", "stim_type_grp_hash")
         cls.insert(
             keys,
             constant_attrs={
@@ -531,6 +767,9 @@ class OrientationScanSet(minnie_function.OrientationScanSet):
 
 
 # Oracle
+OracleSummary = namedtuple("OracleSummary", ["scan_keys", "oracle"])
+
+
 ## Faithful copy of data
 class OracleDVScan1(minnie_function.OracleDVScan1, VMMixin):
 
@@ -543,19 +782,16 @@ class OracleDVScan1(minnie_function.OracleDVScan1, VMMixin):
 
     @classmethod
     def fill(cls):
-        cls.spawn_virtual_modules(cls.virtual_module_dict)
-        keys = minnie_nda.Scan.fetch("KEY")
-        keys = (
-            (cls.virtual_modules["dv_scans_v1_oracle"].TrialVsOracle() & keys)
-            .proj(..., scan_session="session")
-            .fetch("KEY")
-        )
-        for k in keys:
-            cls.insert1(k, skip_duplicates=True, ignore_extra_fields=True)
+        trial_vs_oracle = cls.virtual_modules["dv_scans_v1_oracle"].TrialVsOracle
+        with cls.connection.transaction:
+            cls.insert(
+                trial_vs_oracle.proj(..., scan_session="session") & minnie_nda.Scan,
+                skip_duplicates=True,
+                ignore_extra_fields=True,
+            )
             cls.Unit.insert(
-                (cls.virtual_modules["dv_scans_v1_oracle"].TrialVsOracle.Unit & k)
-                .proj(..., scan_session="session")
-                .fetch(),
+                trial_vs_oracle.Unit.proj(..., scan_session="session")
+                & minnie_nda.Scan,
                 skip_duplicates=True,
                 ignore_extra_fields=True,
             )
@@ -563,30 +799,24 @@ class OracleDVScan1(minnie_function.OracleDVScan1, VMMixin):
 
 class OracleDVScan3(minnie_function.OracleDVScan3):
 
-    dv_oracle = djp.create_djp_module("dv_oracle", "dv_scans_v3_oracle")
+    dv_oracle = LazyVirtualModule("dv_oracle", "dv_scans_v3_oracle")
 
     class Unit(minnie_function.OracleDVScan3.Unit):
         pass
 
     @classmethod
     def fill(cls):
-        keys = minnie_nda.Scan.fetch("KEY")
-        master_rel = dj.U(*cls.primary_key) & cls.dv_oracle.TrialVsOracle.Unit.proj(
-            ..., scan_session="session"
+        unit_rel = (
+            cls.dv_oracle.TrialVsOracle.Unit.proj(..., scan_session="session")
+            & minnie_nda.Scan
         )
-        for k in master_rel & keys:
-            with cls.connection.transaction:
-                cls.insert1(k, skip_duplicates=True, ignore_extra_fields=True)
-                cls.Unit.insert(
-                    (
-                        cls.dv_oracle.TrialVsOracle.Unit.proj(
-                            ..., scan_session="session"
-                        )
-                        & k
-                    ).fetch(),
-                    skip_duplicates=True,
-                    ignore_extra_fields=True,
-                )
+        with cls.connection.transaction:
+            cls.insert(
+                dj.U(*cls.primary_key) & unit_rel,
+                skip_duplicates=True,
+                ignore_extra_fields=True,
+            )
+            cls.Unit.insert(unit_rel, skip_duplicates=True, ignore_extra_fields=True)
 
 
 class OracleTuneMovieOracle(minnie_function.OracleTuneMovieOracle, VMMixin):
@@ -600,7 +830,6 @@ class OracleTuneMovieOracle(minnie_function.OracleTuneMovieOracle, VMMixin):
 
     @classmethod
     def fill(cls):
-        cls.spawn_virtual_modules(cls.virtual_module_dict)
         scan_keys = minnie_nda.Scan.fetch("KEY")
         scan_keys = [
             {**key, "segmentation_method": 6, "spike_method": 5} for key in scan_keys
@@ -626,8 +855,7 @@ class Nn10Scan3Rel(minnie_function.Nn10Scan3Rel, VMMixin):
         pass
 
     @classmethod
-    def fill(cls):
-        cls.spawn_virtual_modules(cls.virtual_module_dict)
+    def fill(cls, confirm=True):
         scan_keys = minnie_nda.Scan.fetch("KEY")
         scan_keys = [
             {**key, "segmentation_method": 6, "spike_method": 5} for key in scan_keys
@@ -641,50 +869,46 @@ class Nn10Scan3Rel(minnie_function.Nn10Scan3Rel, VMMixin):
         if len(scan_keys) == 0:
             return
         print(f"Inserting {len(scan_keys)} scan keys:")
-        for scan_key in scan_keys:
-            print(scan_keys)
-        if input("Proceed? [y/n]") != "y":
+        print("\n".join(map(str, scan_keys)))
+        if confirm and input("Proceed? [y/n]") != "y":
             return
-        for scan_key in scan_keys:
-            with dj.conn().transaction:
-                cls.insert1(scan_key, skip_duplicates=True, ignore_extra_fields=True)
-                rel_df = (
-                    (
-                        cls.virtual_modules["is_scan"].Reliability.Unit.proj(
-                            ..., scan_session="session"
-                        )
-                        & scan_key
-                    )
-                    .fetch(format="frame")
-                    .reset_index()
-                )
-                cls.Unit.insert(
-                    rel_df.to_dict("records"),
-                    skip_duplicates=True,
-                    ignore_extra_fields=True,
-                )
-                unit_df = (
-                    (
-                        cls.virtual_modules["iv_scan"].Unit.proj(
-                            ..., scan_session="session"
-                        )
-                        & scan_key
-                    )
-                    .fetch(format="frame")
-                    .reset_index()
-                )
-                cls.Unit.insert(
-                    unit_df.assign(**scan_key).to_dict("records"),
-                    skip_duplicates=True,
-                    ignore_extra_fields=True,
-                )  # mark units without reliability score as reliabitily=None
+        rel_rel = (
+            cls.virtual_modules["is_scan"].Reliability.Unit.proj(
+                ..., scan_session="session"
+            )
+            & scan_keys
+        )
+        # attach the master attributes to every unit with a join on the new master rows
+        unit_rel = (
+            cls.virtual_modules["iv_scan"].Unit.proj(scan_session="session")
+            * (cls & scan_keys).proj()
+        )
+        with dj.conn().transaction:
+            cls.insert(scan_keys, skip_duplicates=True, ignore_extra_fields=True)
+            cls.Unit.insert(rel_rel, skip_duplicates=True, ignore_extra_fields=True)
+            # mark units without reliability score as reliabitily=None,
+            # units inserted above are kept by skip_duplicates
+            cls.Unit.insert(unit_rel, skip_duplicates=True, ignore_extra_fields=True)
 
 
 class Oracle(minnie_function.Oracle):
     @classmethod
-    def fill(cls):
-        for part in cls.parts(as_cls=True):
-            part.fill()
+    def fill(cls, processes=1):
+        _fill_parts(cls.parts(as_cls=True), processes=processes)
+
+    def _source(self, key=None):
+        # resolves a single entry to its source table without probing every part table,
+        # the source key is cached per oracle_hash
+        rel = self if key is None else self & key
+        oracle_hash, oracle_type = rel.fetch1(self.hash_name, "oracle_type")
+        part = {p.source.__name__: p for p in self.parts(as_cls=True)}[oracle_type]
+        return part.source & _source_key(part, oracle_hash)
+
+    def summary(self, key=None):
+        # returns an OracleSummary with the scans and the (lazy) oracle relation
+        source = self._source(key)
+        scan_keys = source.fetch("animal_id", "scan_session", "scan_idx", as_dict=True)
+        return OracleSummary(scan_keys=scan_keys, oracle=source.oracle())
 
     class DVScan1(minnie_function.Oracle.DVScan1):
         @classproperty
@@ -693,11 +917,14 @@ class Oracle(minnie_function.Oracle):
 
         @classmethod
         def fill(cls):
+            source = cls.source - cls
+            if not _has_rows(source):
+                return
             constant_attrs = {
                 "oracle_type": cls.source.__name__,
             }
             cls.insert(
-                cls.source,
+                source,
                 insert_to_master=True,
                 constant_attrs=constant_attrs,
                 ignore_extra_fields=True,
@@ -711,11 +938,14 @@ class Oracle(minnie_function.Oracle):
 
         @classmethod
         def fill(cls):
+            source = cls.source - cls
+            if not _has_rows(source):
+                return
             constant_attrs = {
                 "oracle_type": cls.source.__name__,
             }
             cls.insert(
-                cls.source,
+                source,
                 insert_to_master=True,
                 constant_attrs=constant_attrs,
                 ignore_extra_fields=True,
@@ -729,11 +959,14 @@ class Oracle(minnie_function.Oracle):
 
         @classmethod
         def fill(cls):
+            source = cls.source - cls
+            if not _has_rows(source):
+                return
             constant_attrs = {
                 "oracle_type": cls.source.__name__,
             }
             cls.insert(
-                cls.source,
+                source,
                 insert_to_master=True,
                 constant_attrs=constant_attrs,
                 ignore_extra_fields=True,
@@ -747,11 +980,14 @@ class Oracle(minnie_function.Oracle):
 
         @classmethod
         def fill(cls):
+            source = cls.source - cls
+            if not _has_rows(source):
+                return
             constant_attrs = {
                 "oracle_type": cls.source.__name__,
             }
             cls.insert(
-                cls.source,
+                source,
                 insert_to_master=True,
                 constant_attrs=constant_attrs,
                 ignore_extra_fields=True,
@@ -761,18 +997,14 @@ class Oracle(minnie_function.Oracle):
 
 class OracleScanInfo(minnie_function.OracleScanInfo):
     def make(self, key):
-        animal_id, scan_session, scan_idx = (Oracle & key).scan()
-        for k, a, s, c in zip(key, animal_id, scan_session, scan_idx):
-            scan_key = dict(animal_id=a, scan_session=s, scan_idx=c)
-            oracle = (Oracle & key).oracle() & scan_key
-            all_valid_unit = (
-                minnie_nda.UnitSource
-                & f'mask_type = "soma"' & scan_key
-            )
-            assert len(all_valid_unit - oracle) == 0, "Exist units without oracle score!"
-            self.insert1(
-                {**key, "animal_id": a, "scan_session": s, "scan_idx": c}
-            )
+        summary = (Oracle & key).summary()
+        all_valid_unit = (
+            minnie_nda.UnitSource & 'mask_type = "soma"' & summary.scan_keys
+        )
+        assert not _has_rows(
+            all_valid_unit - summary.oracle
+        ), "Exist units without oracle score!"
+        self.insert([{**key, **scan_key} for scan_key in summary.scan_keys])
 
 
 class OracleScanSet(minnie_function.OracleScanSet):
@@ -783,17 +1015,18 @@ class OracleScanSet(minnie_function.OracleScanSet):
     def fill(cls, keys, description=""):
         keys = (OracleScanInfo.proj() & keys).fetch("KEY")
         # check here all scans are unique
-        assert len(OracleScanInfo & keys) == len(
-            minnie_nda.Scan * OracleScanInfo & keys
-        )
+        assert not _has_rows(
+            dj.U("animal_id", "scan_session", "scan_idx").aggr(
+                minnie_nda.Scan * OracleScanInfo & keys, n="count(*)"
+            )
+            & "n > 1"
+        ), "non-unique scans"
         # check all members of a set share the same oracle_type
         assert (
             len(dj.U("oracle_type") & (Oracle & keys)) == 1
         ), "All members of a set must share the same oracle_type"
         scan_keys = (minnie_nda.Scan & (OracleScanInfo & keys)).fetch("KEY")
-        scan_set_hash = ScanSet.add_hash_to_rows(scan_keys)[ScanSet.hash_name].unique()[
-            0
-        ]
+        scan_set_hash = _scan_set_hash(scan_keys)
         cls.insert(
             keys,
             constant_attrs={
@@ -808,14 +1041,111 @@ class OracleScanSet(minnie_function.OracleScanSet):
 
 
 # # Predictive model performance and parameters
+def _fill_nns_v10_scan_v3_model(cls, unit_config, unit_readout, confirm=True):
+    # fills a dv_nns_v10_scan model part trained on the scan units selected by
+    # unit_config ("Unique" or "All"), and its unit readouts into unit_readout;
+    # confirm=False inserts without asking
+    dv_nns_scan = cls.virtual_modules["dv_nns_v10_scan"]
+    dv_scan_dataset = cls.virtual_modules["dv_scans_v3_scan_dataset"]
+    dv_scan = cls.virtual_modules["dv_scans_v3_scan"]
+    keys = minnie_nda.Scan.fetch("KEY")
+    scan_keys = (
+        (
+            (dv_nns_scan.Readout - cls.proj(..., session="scan_session") & keys)
+            * dv_nns_scan.ScanConfig.Scan3
+            * dv_scan_dataset.Dataset
+            * getattr(dv_scan_dataset.UnitConfig(), unit_config)()
+        )
+        .proj(..., scan_session="session")
+        .fetch(as_dict=True)
+    )
+    if len(scan_keys) == 0:
+        logging.info(f"No new models found!")
+        return
+    logging.info(f"Found {len(scan_keys)} models to insert:")
+    print("\n".join(map(str, scan_keys)))
+    if confirm and input("Proceed? [y/n]") != "y":
+        return
+    with dj.conn().transaction:
+        cls.insert(
+            scan_keys,
+            insert_to_master=True,
+            constant_attrs={"dynamic_model_type": cls.__name__},
+            ignore_extra_fields=True,
+        )
+        unit_keys = pd.DataFrame(
+            (
+                (
+                    dv_nns_scan.Readout.Unit.proj(..., unique_unit_id="unit_id")
+                    * dv_scan.Unique.Neuron.proj(..., unique_unit_id="unit_id")
+                    * dv_scan.Unique.Unit
+                ).proj(..., scan_session="session")
+                & scan_keys
+            ).fetch()
+        )
+        unit_keys = _add_hash_to_rows(
+            cls, unit_keys, constant_attrs={"dynamic_model_type": cls.__name__}
+        )
+        _insert_chunks(unit_readout, unit_keys, ignore_extra_fields=True)
+
+
+def _fill_nns_v10_scan_v3_score(
+    cls, dynamic_model_type, score, unit_score, key=None, unique=True, confirm=True
+):
+    # fills a dv_nns_v10_scan score part for the models of dynamic_model_type, score
+    # names the dv_nns_v10_scan table holding the scores and its unit scores go into
+    # unit_score; unique maps the model unit ids to scan units through Unique.Neuron;
+    # confirm=False inserts without asking
+    model_maker = (DynamicModel & {"dynamic_model_type": dynamic_model_type}).maker()
+    model_maker = model_maker if key is None else (model_maker & key)
+    dv_nns_scan = cls.virtual_modules["dv_nns_v10_scan"]
+    dv_scan = cls.virtual_modules["dv_scans_v3_scan"]
+    dv_nns_model = cls.virtual_modules["dv_nns_v10_model"]
+    score = getattr(dv_nns_scan, score)
+    scan_keys = (
+        (score * dv_nns_model.BehaviorConfig.Scan).proj(..., scan_session="session")
+        * model_maker
+        - cls.proj()
+    ).fetch(as_dict=True)
+    if len(scan_keys) == 0:
+        return
+    print(f"Inserting {len(scan_keys)} scan keys:")
+    print("\n".join(map(str, scan_keys)))
+    if confirm and input("Proceed? [y/n]") != "y":
+        return
+    with dj.conn().transaction:
+        cls.insert(
+            scan_keys,
+            insert_to_master=True,
+            constant_attrs={"dynamic_score_type": cls.__name__},
+            ignore_extra_fields=True,
+        )
+        if unique:
+            units = (
+                score.Unit.proj(..., unique_unit_id="unit_id")
+                * dv_nns_model.BehaviorConfig.Scan
+                * dv_scan.Unique.Neuron.proj(..., unique_unit_id="unit_id")
+                * dv_scan.Unique.Unit
+            )
+        else:
+            units = score.Unit * dv_nns_model.BehaviorConfig.Scan
+        unit_keys = pd.DataFrame(
+            (units.proj(..., scan_session="session") * model_maker & scan_keys).fetch()
+        )
+        unit_keys = _add_hash_to_rows(
+            cls, unit_keys, constant_attrs={"dynamic_score_type": cls.__name__}
+        )
+        _insert_chunks(unit_score, unit_keys, ignore_extra_fields=True)
+
+
 ## Aggregation tables
 class DynamicModel(minnie_function.DynamicModel):
     @classmethod
-    def fill(cls):
+    def fill(cls, confirm=True):
         for p in cls.parts(as_cls=True):
             if hasattr(p, "fill"):
                 logging.info('Filling "{}"'.format(p.__name__))
-                p.fill()
+                p.fill(**_accepted_kws(p.fill, confirm=confirm))
 
     class NnsV5(minnie_function.DynamicModel.NnsV5, VMMixin):
         virtual_module_dict = {
@@ -824,34 +1154,29 @@ class DynamicModel(minnie_function.DynamicModel):
 
         @classmethod
         def fill(cls):
-            cls.spawn_virtual_modules(cls.virtual_module_dict)
+            dv_nns_scan = cls.virtual_modules["dv_nns_v5_scan"]
             keys = minnie_nda.Scan.fetch("KEY")
             scan_keys = (
-                cls.virtual_modules["dv_nns_v5_scan"].Readout.proj(
-                    ..., scan_session="session"
-                )
-                - cls
-                & keys
+                dv_nns_scan.Readout.proj(..., scan_session="session") - cls & keys
             ).fetch(as_dict=True)
-            for scan_key in scan_keys:
-                cls.insert1(
-                    scan_key,
+            if not scan_keys:
+                return
+            with dj.conn().transaction:
+                cls.insert(
+                    scan_keys,
                     insert_to_master=True,
                     constant_attrs={"dynamic_model_type": cls.__name__},
                     ignore_extra_fields=True,
                 )
-                unit_keys = (
+                unit_keys = pd.DataFrame(
                     (
-                        cls.virtual_modules["dv_nns_v5_scan"].Readout.Unit.proj(
-                            ..., scan_session="session"
-                        )
-                        & scan_key
-                    )
-                    .fetch(format="frame")
-                    .reset_index()
+                        dv_nns_scan.Readout.Unit.proj(..., scan_session="session")
+                        & scan_keys
+                    ).fetch()
                 )
-                unit_keys = cls.add_hash_to_rows(unit_keys)
-                DynamicModel.NnsV5UnitReadout.insert(
+                unit_keys = _add_hash_to_rows(cls, unit_keys)
+                _insert_chunks(
+                    DynamicModel.NnsV5UnitReadout,
                     unit_keys,
                     constant_attrs={"dynamic_model_type": cls.__name__},
                     ignore_extra_fields=True,
@@ -868,63 +1193,13 @@ class DynamicModel(minnie_function.DynamicModel):
         }
 
         @classmethod
-        def fill(cls):
-            cls.spawn_virtual_modules(cls.virtual_module_dict)
-            keys = minnie_nda.Scan.fetch("KEY")
-            scan_keys = (
-                (
-                    (
-                        cls.virtual_modules["dv_nns_v10_scan"].Readout
-                        - cls.proj(..., session="scan_session")
-                        & keys
-                    )
-                    * cls.virtual_modules["dv_nns_v10_scan"].ScanConfig.Scan3
-                    * cls.virtual_modules["dv_scans_v3_scan_dataset"].Dataset
-                    * cls.virtual_modules["dv_scans_v3_scan_dataset"]
-                    .UnitConfig()
-                    .Unique()
-                )
-                .proj(..., scan_session="session")
-                .fetch(as_dict=True)
+        def fill(cls, confirm=True):
+            _fill_nns_v10_scan_v3_model(
+                cls,
+                "Unique",
+                DynamicModel.NnsV10ScanV3UniqueUnitReadout,
+                confirm=confirm,
             )
-            if len(scan_keys) == 0:
-                logging.info(f"No new models found!")
-                return
-            logging.info(f"Found {len(scan_keys)} models to insert:")
-            for scan_key in scan_keys:
-                print(scan_key)
-            if input("Continue? [y/n]") != "y":
-                return
-            for scan_key in scan_keys:
-                with dj.conn().transaction:
-                    cls.insert1(
-                        scan_key,
-                        insert_to_master=True,
-                        constant_attrs={"dynamic_model_type": cls.__name__},
-                        ignore_extra_fields=True,
-                    )
-                    unit_keys = (
-                        (
-                            (
-                                cls.virtual_modules[
-                                    "dv_nns_v10_scan"
-                                ].Readout.Unit.proj(..., unique_unit_id="unit_id")
-                                * cls.virtual_modules[
-                                    "dv_scans_v3_scan"
-                                ].Unique.Neuron.proj(..., unique_unit_id="unit_id")
-                                * cls.virtual_modules["dv_scans_v3_scan"].Unique.Unit
-                            ).proj(..., scan_session="session")
-                            & scan_key
-                        )
-                        .fetch(format="frame")
-                        .reset_index()
-                    )
-                    unit_keys["dynamic_model_type"] = cls.__name__
-                    unit_keys = cls.add_hash_to_rows(unit_keys)
-                    DynamicModel.NnsV10ScanV3UniqueUnitReadout.insert(
-                        unit_keys,
-                        ignore_extra_fields=True,
-                    )
 
     class NnsV10ScanV3UniqueUnitReadout(
         minnie_function.DynamicModel.NnsV10ScanV3UniqueUnitReadout
@@ -936,16 +1211,18 @@ class DynamicModel(minnie_function.DynamicModel):
     ):
         @classmethod
         def fill(cls, display_progress=True):
-            scan3_perspective = dj.FreeTable(
-                dj.conn(), "`dv_nns_v10_scan`.`__perspective__unit`"
-            ).proj(..., scan_session="session")
-            scan3_unique_neuron = dj.FreeTable(
-                dj.conn(), "`dv_scans_v3_scan`.`__unique__neuron`"
+            scan3_perspective = _free_table(
+                "`dv_nns_v10_scan`.`__perspective__unit`"
             ).proj(..., scan_session="session")
-            scan3_unique_unit = dj.FreeTable(
-                dj.conn(), "`dv_scans_v3_scan`.`__unique__unit`"
+            scan3_unique_neuron = _free_table(
+                "`dv_scans_v3_scan`.`__unique__neuron`"
             ).proj(..., scan_session="session")
-            keys = ((DynamicModel.NnsV10ScanV3Unique & scan3_perspective) - cls).fetch("KEY")
+            scan3_unique_unit = _free_table("`dv_scans_v3_scan`.`__unique__unit`").proj(
+                ..., scan_session="session"
+            )
+            keys = ((DynamicModel.NnsV10ScanV3Unique & scan3_perspective) - cls).fetch(
+                "KEY"
+            )
             for k in tqdm(keys, disable=not display_progress):
                 rel = scan3_perspective & k
                 rel = (
@@ -967,61 +1244,10 @@ class DynamicModel(minnie_function.DynamicModel):
         }
 
         @classmethod
-        def fill(cls):
-            cls.spawn_virtual_modules(cls.virtual_module_dict)
-            keys = minnie_nda.Scan.fetch("KEY")
-            scan_keys = (
-                (
-                    (
-                        cls.virtual_modules["dv_nns_v10_scan"].Readout
-                        - cls.proj(..., session="scan_session")
-                        & keys
-                    )
-                    * cls.virtual_modules["dv_nns_v10_scan"].ScanConfig.Scan3
-                    * cls.virtual_modules["dv_scans_v3_scan_dataset"].Dataset
-                    * cls.virtual_modules["dv_scans_v3_scan_dataset"].UnitConfig().All()
-                )
-                .proj(..., scan_session="session")
-                .fetch(as_dict=True)
+        def fill(cls, confirm=True):
+            _fill_nns_v10_scan_v3_model(
+                cls, "All", DynamicModel.NnsV10ScanV3AllUnitReadout, confirm=confirm
             )
-            logging.info(f"Found {len(scan_keys)} models to insert!")
-            if len(scan_keys) == 0:
-                logging.info(f"No new models found!")
-                return
-            for scan_key in scan_keys:
-                print(scan_key)
-            if input("Proceed? (y/n)") != "y":
-                return
-            for scan_key in scan_keys:
-                with dj.conn().transaction:
-                    cls.insert1(
-                        scan_key,
-                        insert_to_master=True,
-                        constant_attrs={"dynamic_model_type": cls.__name__},
-                        ignore_extra_fields=True,
-                    )
-                    unit_keys = (
-                        (
-                            (
-                                cls.virtual_modules[
-                                    "dv_nns_v10_scan"
-                                ].Readout.Unit.proj(..., unique_unit_id="unit_id")
-                                * cls.virtual_modules[
-                                    "dv_scans_v3_scan"
-                                ].Unique.Neuron.proj(..., unique_unit_id="unit_id")
-                                * cls.virtual_modules["dv_scans_v3_scan"].Unique.Unit
-                            ).proj(..., scan_session="session")
-                            & scan_key
-                        )
-                        .fetch(format="frame")
-                        .reset_index()
-                    )
-                    unit_keys["dynamic_model_type"] = cls.__name__
-                    unit_keys = cls.add_hash_to_rows(unit_keys)
-                    DynamicModel.NnsV10ScanV3AllUnitReadout.insert(
-                        unit_keys,
-                        ignore_extra_fields=True,
-                    )
 
     class NnsV10ScanV3AllUnitReadout(
         minnie_function.DynamicModel.NnsV10ScanV3AllUnitReadout
@@ -1037,17 +1263,17 @@ class DynamicModelScore(minnie_function.DynamicModelScore):
         }
 
         @classmethod
-        def fill(cls, key=None):
+        def fill(cls, key=None, confirm=True):
             model_maker = (
                 DynamicModel & f"dynamic_model_type='{cls.__name__}'"
             ).maker()
             model_maker = model_maker if key is None else (model_maker & key)
-            cls.spawn_virtual_modules(cls.virtual_module_dict)
+            dv_nns_scan = cls.virtual_modules["dv_nns_v5_scan"]
+            dv_nns_model = cls.virtual_modules["dv_nns_v5_model"]
             scan_keys = (
-                (
-                    cls.virtual_modules["dv_nns_v5_scan"].TrialVsModel
-                    * cls.virtual_modules["dv_nns_v5_model"].BehaviorConfig.Scan
-                ).proj(..., scan_session="session")
+                (dv_nns_scan.TrialVsModel * dv_nns_model.BehaviorConfig.Scan).proj(
+                    ..., scan_session="session"
+                )
                 * model_maker
                 - cls.proj()
             ).fetch(
@@ -1056,31 +1282,29 @@ class DynamicModelScore(minnie_function.DynamicModelScore):
             if len(scan_keys) == 0:
                 return
             print(f"Inserting {len(scan_keys)} scan keys:")
-            for scan_key in scan_keys:
-                print(scan_keys)
-            if input("Proceed? [y/n]") != "y":
+            print("\n".join(map(str, scan_keys)))
+            if confirm and input("Proceed? [y/n]") != "y":
                 return
-            for scan_key in tqdm(scan_keys):
-                cls.insert1(
-                    scan_key,
+            with dj.conn().transaction:
+                cls.insert(
+                    scan_keys,
                     insert_to_master=True,
                     constant_attrs={"dynamic_score_type": cls.__name__},
                     ignore_extra_fields=True,
                 )
-                unit_keys = (
+                unit_keys = pd.DataFrame(
                     (
                         (
-                            cls.virtual_modules["dv_nns_v5_scan"].TrialVsModel.Unit
-                            * cls.virtual_modules["dv_nns_v5_model"].BehaviorConfig.Scan
+                            dv_nns_scan.TrialVsModel.Unit
+                            * dv_nns_model.BehaviorConfig.Scan
                         ).proj(..., scan_session="session")
                         * model_maker
-                        & scan_key
-                    )
-                    .fetch(format="frame")
-                    .reset_index()
+                        & scan_keys
+                    ).fetch()
                 )
-                unit_keys = cls.add_hash_to_rows(unit_keys)
-                DynamicModelScore.NnsV5UnitScore.insert(
+                unit_keys = _add_hash_to_rows(cls, unit_keys)
+                _insert_chunks(
+                    DynamicModelScore.NnsV5UnitScore,
                     unit_keys,
                     constant_attrs={"dynamic_model_type": cls.__name__},
                     ignore_extra_fields=True,
@@ -1100,61 +1324,15 @@ class DynamicModelScore(minnie_function.DynamicModelScore):
         }
 
         @classmethod
-        def fill(cls, key=None):
-            model_maker = (
-                DynamicModel & f"dynamic_model_type='{cls.__name__}'"
-            ).maker()
-            model_maker = model_maker if key is None else (model_maker & key)
-            cls.spawn_virtual_modules(cls.virtual_module_dict)
-            scan_keys = (
-                (
-                    cls.virtual_modules["dv_nns_v10_scan"].TrialVsModel
-                    * cls.virtual_modules["dv_nns_v10_model"].BehaviorConfig.Scan
-                ).proj(..., scan_session="session")
-                * model_maker
-                - cls.proj()
-            ).fetch(as_dict=True)
-            if len(scan_keys) == 0:
-                return
-            print(f"Inserting {len(scan_keys)} scan keys:")
-            for scan_key in scan_keys:
-                print(scan_keys)
-            if input("Proceed? [y/n]") != "y":
-                return
-            for scan_key in tqdm(scan_keys):
-                with dj.conn().transaction:
-                    cls.insert1(
-                        scan_key,
-                        insert_to_master=True,
-                        constant_attrs={"dynamic_score_type": cls.__name__},
-                        ignore_extra_fields=True,
-                    )
-                    unit_keys = (
-                        (
-                            (
-                                cls.virtual_modules[
-                                    "dv_nns_v10_scan"
-                                ].TrialVsModel.Unit.proj(..., unique_unit_id="unit_id")
-                                * cls.virtual_modules[
-                                    "dv_nns_v10_model"
-                                ].BehaviorConfig.Scan
-                                * cls.virtual_modules[
-                                    "dv_scans_v3_scan"
-                                ].Unique.Neuron.proj(..., unique_unit_id="unit_id")
-                                * cls.virtual_modules["dv_scans_v3_scan"].Unique.Unit
-                            ).proj(..., scan_session="session")
-                            * model_maker
-                            & scan_key
-                        )
-                        .fetch(format="frame")
-                        .reset_index()
-                    )
-                    unit_keys["dynamic_score_type"] = cls.__name__
-                    unit_keys = cls.add_hash_to_rows(unit_keys)
-                    DynamicModelScore.NnsV10ScanV3UniqueUnitScore.insert(
-                        unit_keys,
-                        ignore_extra_fields=True,
-                    )
+        def fill(cls, key=None, confirm=True):
+            _fill_nns_v10_scan_v3_score(
+                cls,
+                "NnsV10ScanV3Unique",
+                "TrialVsModel",
+                DynamicModelScore.NnsV10ScanV3UniqueUnitScore,
+                key=key,
+                confirm=confirm,
+            )
 
     class NnsV10ScanV3UniqueUnitScore(
         minnie_function.DynamicModelScore.NnsV10ScanV3UniqueUnitScore
@@ -1172,71 +1350,22 @@ class DynamicModelScore(minnie_function.DynamicModelScore):
         }
 
         @classmethod
-        def fill(cls, key=None):
-            model_maker = (
-                DynamicModel & f"dynamic_model_type='NnsV10ScanV3Unique'"
-            ).maker()
-            model_maker = model_maker if key is None else (model_maker & key)
-            cls.spawn_virtual_modules(cls.virtual_module_dict)
-            scan_keys = (
-                (
-                    cls.virtual_modules["dv_nns_v10_scan"].ModelScore
-                    * cls.virtual_modules["dv_nns_v10_model"].BehaviorConfig.Scan
-                ).proj(..., scan_session="session")
-                * model_maker
-                - cls.proj()
-            ).fetch(as_dict=True)
-            if len(scan_keys) == 0:
-                return
-            print(f"Inserting {len(scan_keys)} scan keys:")
-            for scan_key in scan_keys:
-                print(scan_keys)
-            if input("Proceed? [y/n]") != "y":
-                return
-            for scan_key in tqdm(scan_keys):
-                with dj.conn().transaction:
-                    cls.insert1(
-                        scan_key,
-                        insert_to_master=True,
-                        constant_attrs={"dynamic_score_type": cls.__name__},
-                        ignore_extra_fields=True,
-                    )
-                    unit_keys = (
-                        (
-                            (
-                                cls.virtual_modules[
-                                    "dv_nns_v10_scan"
-                                ].ModelScore.Unit.proj(..., unique_unit_id="unit_id")
-                                * cls.virtual_modules[
-                                    "dv_nns_v10_model"
-                                ].BehaviorConfig.Scan
-                                * cls.virtual_modules[
-                                    "dv_scans_v3_scan"
-                                ].Unique.Neuron.proj(..., unique_unit_id="unit_id")
-                                * cls.virtual_modules["dv_scans_v3_scan"].Unique.Unit
-                            ).proj(..., scan_session="session")
-                            * model_maker
-                            & scan_key
-                        )
-                        .fetch(format="frame")
-                        .reset_index()
-                    )
-                    unit_keys["dynamic_score_type"] = cls.__name__
-                    unit_keys = cls.add_hash_to_rows(unit_keys)
-                    DynamicModelScore.Nns10Scan3UniqueCcUnitScore.insert(
-                        unit_keys,
-                        ignore_extra_fields=True,
-                    )
+        def fill(cls, key=None, confirm=True):
+            _fill_nns_v10_scan_v3_score(
+                cls,
+                "NnsV10ScanV3Unique",
+                "ModelScore",
+                DynamicModelScore.Nns10Scan3UniqueCcUnitScore,
+                key=key,
+                confirm=confirm,
+            )
 
     class Nns10Scan3UniqueCcUnitScore(
         minnie_function.DynamicModelScore.Nns10Scan3UniqueCcUnitScore
     ):
         pass
 
-
-    class Nns10Scan3AllCc(
-        minnie_function.DynamicModelScore.Nns10Scan3AllCc, VMMixin
-    ):
+    class Nns10Scan3AllCc(minnie_function.DynamicModelScore.Nns10Scan3AllCc, VMMixin):
         virtual_module_dict = {
             "dv_nns_v10_scan": "dv_nns_v10_scan",
             "dv_scans_v3_scan_dataset": "dv_scans_v3_scan_dataset",
@@ -1245,57 +1374,16 @@ class DynamicModelScore(minnie_function.DynamicModelScore):
         }
 
         @classmethod
-        def fill(cls, key=None):
-            model_maker = (
-                DynamicModel & "dynamic_model_type='NnsV10ScanV3All'"
-            ).maker()
-            model_maker = model_maker if key is None else (model_maker & key)
-            cls.spawn_virtual_modules(cls.virtual_module_dict)
-            scan_keys = (
-                (
-                    cls.virtual_modules["dv_nns_v10_scan"].ModelScore
-                    * cls.virtual_modules["dv_nns_v10_model"].BehaviorConfig.Scan
-                ).proj(..., scan_session="session")
-                * model_maker
-                - cls.proj()
-            ).fetch(as_dict=True)
-            if len(scan_keys) == 0:
-                return
-            print(f"Inserting {len(scan_keys)} scan keys:")
-            for scan_key in scan_keys:
-                print(scan_keys)
-            if input("Proceed? [y/n]") != "y":
-                return
-            for scan_key in tqdm(scan_keys):
-                with dj.conn().transaction:
-                    cls.insert1(
-                        scan_key,
-                        insert_to_master=True,
-                        constant_attrs={"dynamic_score_type": cls.__name__},
-                        ignore_extra_fields=True,
-                    )
-                    unit_keys = (
-                        (
-                            (
-                                cls.virtual_modules[
-                                    "dv_nns_v10_scan"
-                                ].ModelScore.Unit
-                                * cls.virtual_modules[
-                                    "dv_nns_v10_model"
-                                ].BehaviorConfig.Scan
-                            ).proj(..., scan_session="session")
-                            * model_maker
-                            & scan_key
-                        )
-                        .fetch(format="frame")
-                        .reset_index()
-                    )
-                    unit_keys["dynamic_score_type"] = cls.__name__
-                    unit_keys = cls.add_hash_to_rows(unit_keys)
-                    DynamicModelScore.Nns10Scan3AllCcUnitScore.insert(
-                        unit_keys,
-                        ignore_extra_fields=True,
-                    )
+        def fill(cls, key=None, confirm=True):
+            _fill_nns_v10_scan_v3_score(
+                cls,
+                "NnsV10ScanV3All",
+                "ModelScore",
+                DynamicModelScore.Nns10Scan3AllCcUnitScore,
+                key=key,
+                confirm=confirm,
+                unique=False,
+            )
 
     class Nns10Scan3AllCcUnitScore(
         minnie_function.DynamicModelScore.Nns10Scan3AllCcUnitScore
@@ -1303,11 +1391,11 @@ class DynamicModelScore(minnie_function.DynamicModelScore):
         pass
 
     @classmethod
-    def fill(cls):
+    def fill(cls, confirm=True):
         for p in cls.parts(as_cls=True):
             if hasattr(p, "fill"):
                 print(f"Checking {p.__name__}:")
-                p.fill()
+                p.fill(**_accepted_kws(p.fill, confirm=confirm))
 
 class DynamicModelScanSet(minnie_function.DynamicModelScanSet):
     class Member(minnie_function.DynamicModelScanSet.Member):
@@ -1316,14 +1404,14 @@ class DynamicModelScanSet(minnie_function.DynamicModelScanSet):
     @classmethod
     def fill(cls, keys, name, description=""):
         keys = (DynamicModel.proj() & keys).fetch("KEY")
-        # check if all scans are unique
-        assert len(DynamicModel & keys) == len(minnie_nda.Scan * DynamicModel & keys)
+        # check if all scans are unique, one scan per member
+        scan_keys = (minnie_nda.Scan & (DynamicModel & keys)).fetch("KEY")
+        assert len(scan_keys) == len(keys), "All members of a set must have unique scans"
         # check if all members of a set share the same readout_type
         assert (
             type((DynamicModel & keys).maker()) != list
         ), "All members of a set must share the same maker"
-        scan_keys = (minnie_nda.Scan & (DynamicModel & keys)).fetch("KEY")
-        scan_set_hash = ScanSet.hash1(scan_keys, unique=True)
+        scan_set_hash = _scan_set_hash(scan_keys)
         cls.insert(
             keys,
             constant_attrs={
@@ -1354,7 +1442,7 @@ class RespCorr(minnie_function.RespCorr):
         @classmethod
         def fill(cls):
             content = (RespArrNnsV10 - cls) * DynamicModelScanSet.proj("scan_set_hash")
-            df = pd.DataFrame(content.fetch("KEY", "scan_set_hash", as_dict=True))
+            df = content.proj("scan_set_hash").fetch(format="frame").reset_index()
             df["resp_corr_type"] = cls.__name__
             cls.insert(
                 df,